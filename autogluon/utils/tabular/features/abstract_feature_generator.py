@@ -17,6 +17,9 @@ from ..utils.savers import save_pkl
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import, check_if_nlp_feature runs it per unique value.
+_WHITESPACE_RUN_RE = re.compile(' +')
+
 
 # TODO: Add feature of # of observation counts to high cardinality categorical features
 # TODO: Use code from problem type detection for column types! Ints/Floats could be Categorical through this method! Maybe try both?
@@ -224,7 +227,7 @@ class AbstractFeatureGenerator:
         # print(X_unique)
         if unique_ratio <= 0.01:
             return False
-        avg_words = np.mean([len(re.sub(' +', ' ', value).split(' ')) if isinstance(value, str) else 0 for value in X_unique])
+        avg_words = np.mean([len(_WHITESPACE_RUN_RE.sub(' ', value).split(' ')) if isinstance(value, str) else 0 for value in X_unique])
         # print(avg_words)
         if avg_words < 3:
             return False
@@ -240,7 +243,10 @@ class AbstractFeatureGenerator:
 
     def minimize_ngram_memory_usage(self, X_features):
         if 'text_ngram' in self.feature_type_family_generated and self.feature_type_family_generated['text_ngram']:
-            X_features[self.feature_type_family_generated['text_ngram']] = np.clip(X_features[self.feature_type_family_generated['text_ngram']], 0, 255).astype('uint8')
+            # Sparse-backed ngram columns already hold the narrow vectorizer dtype, clipping them here would densify the data.
+            dense_ngram_features = [feature for feature in self.feature_type_family_generated['text_ngram'] if not isinstance(X_features[feature].dtype, pd.SparseDtype)]
+            if dense_ngram_features:
+                X_features[dense_ngram_features] = np.clip(X_features[dense_ngram_features], 0, 255).astype('uint8')
         return X_features
 
     def minimize_binned_memory_usage(self, X_features):
@@ -312,8 +318,9 @@ class AbstractFeatureGenerator:
         mapping_dict = {k: v for v, k in enumerate(list(mapping))}
         series_out = pd.cut(series, mapping)
         # series_out.cat.categories = [str(g) for g in series_out.cat.categories]  # LightGBM crashes at end of training without this
-        series_out_int = [mapping_dict[val] for val in series_out]
-        return series_out_int
+        # Categorical.map keeps category dtype, but binned columns must stay plain ints so they are
+        # not swept up by the category handling in _fit_transform
+        return series_out.map(mapping_dict).astype('int64')
 
     # TODO: Rewrite with normalized value counts as binning technique, will be more performant and optimal
     @staticmethod
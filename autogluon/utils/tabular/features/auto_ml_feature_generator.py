@@ -6,21 +6,45 @@ import traceback
 import numpy as np
 import pandas as pd
 import psutil
+from joblib import Parallel, delayed, effective_n_jobs
 from pandas import DataFrame, Series
+from scipy.sparse import hstack, vstack
 
+from . import text_special_kernels
 from .abstract_feature_generator import AbstractFeatureGenerator
 from .vectorizers import get_ngram_freq, downscale_vectorizer
-from .vectorizers import vectorizer_auto_ml_default
+from .vectorizers import vectorizer_auto_ml_default, vectorizer_hashing_default
 
 logger = logging.getLogger(__name__)
 
+# pandas 0.25+ can back DataFrame columns with sparse arrays, letting ngram features stay in CSR form instead of being densified.
+_PANDAS_SPARSE_DATAFRAME = hasattr(pd.DataFrame, 'sparse')
+
 
 # TODO: Add verbose descriptions of each special dtype this generator can create.
 class AutoMLFeatureGenerator(AbstractFeatureGenerator):
+    # Predicted ngram feature sizes below this skip the psutil memory checks entirely (syscalls, tens of us each)
+    NGRAM_MEMORY_CHECK_THRESHOLD_BYTES = 256 * 1024 * 1024
+    # Inputs smaller than this are transformed in-process, chunked parallel transform would only add dispatch overhead
+    TEXT_TRANSFORM_CHUNK_MIN_ROWS = 10000
+    # Rows sampled when estimating vocabulary size for the hashing-vectorizer fallback decision
+    VOCAB_ESTIMATE_SAMPLE_ROWS = 1000
+
+    symbols = ['!', '?', '@', '%', '$', '*', '&', '#', '^', '.', ':', ' ', '/', ';', '-', '=']
+    _drop_space_table = str.maketrans('', '', ' ')  # precomputed so the per-row ratio helpers avoid per-call replace machinery
+
     def __init__(self, enable_text_ngram_features=True, enable_text_special_features=True,
                  enable_categorical_features=True, enable_raw_features=True, enable_datetime_features=True,
-                 vectorizer=None):
+                 vectorizer=None, vectorizer_strategy='combined', n_jobs=-1, enable_hashing_fallback=False):
         super().__init__()
+        # 'combined' fits one vectorizer over all text features joined into a single stream,
+        # 'separate' fits one vectorizer per text feature, in parallel across n_jobs workers.
+        if vectorizer_strategy not in ['combined', 'separate']:
+            raise ValueError(f"vectorizer_strategy must be one of ['combined', 'separate'], but vectorizer_strategy is {vectorizer_strategy}")
+        self.vectorizer_strategy = vectorizer_strategy
+        self.n_jobs = n_jobs
+        self.enable_hashing_fallback = enable_hashing_fallback
+        self.vectorizer_hashing_raw = vectorizer_hashing_default() if enable_hashing_fallback else None
         self.enable_nlp_features = enable_text_ngram_features
         self.enable_text_special_features = enable_text_special_features
         self.enable_categorical_features = enable_categorical_features
@@ -30,6 +54,9 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
             self.vectorizer_default_raw = vectorizer_auto_ml_default()
         else:
             self.vectorizer_default_raw = vectorizer
+            # sklearn vectorizers default to int64 counts, ngram counts comfortably fit in int32 and halve the bytes moved if densified
+            if getattr(self.vectorizer_default_raw, 'dtype', None) == np.int64:
+                self.vectorizer_default_raw.dtype = np.int32
         self.vectorizers = []
 
     def _compute_feature_transformations(self):
@@ -103,27 +130,42 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
                 # TODO: Add fastai date features
 
         if self.feature_transformations['text_ngram']:
-            # Combine Text Fields
-            features_nlp_current = ['__nlp__']
+            if self.vectorizer_strategy == 'combined':
+                # Combine Text Fields
+                features_nlp_current = ['__nlp__']
+            else:
+                features_nlp_current = list(self.feature_transformations['text_ngram'])
 
             if not self.fit:
                 features_nlp_to_remove = []
                 logger.log(15, 'Fitting vectorizer for text features: ' + str(self.feature_transformations['text_ngram']))
+                text_lists = []
                 for nlp_feature in features_nlp_current:
                     # TODO: Preprocess text?
                     if nlp_feature == '__nlp__':
-                        text_list = list(set(['. '.join(row) for row in X[self.feature_transformations['text_ngram']].values]))
+                        text_lists.append(self._get_joined_text(X, drop_duplicates=True))
                     else:
-                        text_list = list(X[nlp_feature].drop_duplicates().values)
-                    vectorizer_raw = copy.deepcopy(self.vectorizer_default_raw)
-                    try:
-                        vectorizer_fit, _ = self.train_vectorizer(text_list, vectorizer_raw)
-                        self.vectorizers.append(vectorizer_fit)
-                    except ValueError:
+                        text_lists.append(list(X[nlp_feature].drop_duplicates().values))
+                vectorizer_raw = self.vectorizer_default_raw
+                if self.enable_hashing_fallback and self._should_use_hashing_vectorizer(X, text_lists):
+                    logger.log(20, 'Predicted ngram memory usage is too high for a stored vocabulary, using HashingVectorizer for text features')
+                    vectorizer_raw = self.vectorizer_hashing_raw
+                if len(features_nlp_current) > 1:
+                    vectorizers_fit = Parallel(n_jobs=self.n_jobs)(delayed(self._train_vectorizer_or_none)(text_list, copy.deepcopy(vectorizer_raw)) for text_list in text_lists)
+                else:
+                    vectorizers_fit = [self._train_vectorizer_or_none(text_lists[0], copy.deepcopy(vectorizer_raw))]
+                for nlp_feature, vectorizer_fit in zip(features_nlp_current, vectorizers_fit):
+                    if vectorizer_fit is None:
                         logger.debug("Removing 'text_ngram' features due to error")
-                        features_nlp_to_remove = self.feature_transformations['text_ngram']
+                        if nlp_feature == '__nlp__':
+                            features_nlp_to_remove = self.feature_transformations['text_ngram']
+                        else:
+                            features_nlp_to_remove.append(nlp_feature)
+                    else:
+                        self.vectorizers.append(vectorizer_fit)
 
                 self.feature_transformations['text_ngram'] = [feature for feature in self.feature_transformations['text_ngram'] if feature not in features_nlp_to_remove]
+                features_nlp_current = [feature for feature in features_nlp_current if feature == '__nlp__' or feature not in features_nlp_to_remove]
 
             X_features_cols_prior_to_nlp = list(X_features.columns)
             downsample_ratio = None
@@ -149,6 +191,9 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
                     X_features = X_features[X_features_cols_prior_to_nlp]
                     skip_nlp = False
                     for vectorizer in self.vectorizers:
+                        if not hasattr(vectorizer, 'vocabulary_'):  # hashing vectorizers have no vocabulary to shrink
+                            skip_nlp = True
+                            break
                         vocab_size = len(vectorizer.vocabulary_)
                         if vocab_size <= 50:
                             skip_nlp = True
@@ -175,26 +220,33 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
         return X_features
 
     def generate_text_ngrams(self, X, features_nlp_current, downsample_ratio: int = None):
-        X_nlp_features_combined = []
+        transform_matrices = []
+        nlp_features_columns = []
+        nlp_features_totals = []
         for i, nlp_feature in enumerate(features_nlp_current):
             vectorizer_fit = self.vectorizers[i]
 
             if nlp_feature == '__nlp__':
-                text_data = ['. '.join(row) for row in X[self.feature_transformations['text_ngram']].values]
+                text_data = self._get_joined_text(X)
             else:
                 text_data = X[nlp_feature].values
-            transform_matrix = vectorizer_fit.transform(text_data)
-
-            if not self.fit:
-                predicted_ngrams_memory_usage_bytes = len(X) * 8 * (transform_matrix.shape[1] + 1) + 80
-                mem_avail = psutil.virtual_memory().available
-                mem_rss = psutil.Process().memory_info().rss
-                # TODO: 0.25 causes OOM error with 72 GB ram on nyc-wendykan-lending-club-loan-data, fails on NN or Catboost, distributed.worker spams logs with memory warnings
-                # TODO: 0.20 causes OOM error with 64 GB ram on NN with several datasets. LightGBM and CatBoost succeed
-                max_memory_percentage = 0.15  # TODO: Finetune this, or find a better metric
-                predicted_rss = mem_rss + predicted_ngrams_memory_usage_bytes
-                predicted_percentage = predicted_rss / mem_avail
-                if downsample_ratio is None:
+            transform_matrix = self._transform_text(vectorizer_fit, text_data)
+
+            # HashingVectorizer stores no vocabulary: nothing to downscale, and memory is already bounded by n_features
+            if not self.fit and hasattr(vectorizer_fit, 'vocabulary_'):
+                if _PANDAS_SPARSE_DATAFRAME:
+                    # CSR storage: data + indices per nonzero element, plus the indptr array
+                    predicted_ngrams_memory_usage_bytes = transform_matrix.nnz * (transform_matrix.dtype.itemsize + 4) + (len(X) + 1) * 4 + 80
+                else:
+                    predicted_ngrams_memory_usage_bytes = len(X) * transform_matrix.dtype.itemsize * (transform_matrix.shape[1] + 1) + 80
+                if downsample_ratio is None and predicted_ngrams_memory_usage_bytes > self.NGRAM_MEMORY_CHECK_THRESHOLD_BYTES:
+                    mem_avail = psutil.virtual_memory().available
+                    mem_rss = psutil.Process().memory_info().rss
+                    # TODO: 0.25 causes OOM error with 72 GB ram on nyc-wendykan-lending-club-loan-data, fails on NN or Catboost, distributed.worker spams logs with memory warnings
+                    # TODO: 0.20 causes OOM error with 64 GB ram on NN with several datasets. LightGBM and CatBoost succeed
+                    max_memory_percentage = 0.15  # TODO: Finetune this, or find a better metric
+                    predicted_rss = mem_rss + predicted_ngrams_memory_usage_bytes
+                    predicted_percentage = predicted_rss / mem_avail
                     if predicted_percentage > max_memory_percentage:
                         downsample_ratio = max_memory_percentage / predicted_percentage
                         logger.warning('Warning: Due to memory constraints, ngram feature count is being reduced. Allocate more memory to maximize model quality.')
@@ -206,40 +258,94 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
                     downsampled_vocab_size = int(np.floor(vocab_size * downsample_ratio))
                     logger.log(20, f'Reducing Vectorizer vocab size from {vocab_size} to {downsampled_vocab_size} to avoid OOM error')
                     ngram_freq = get_ngram_freq(vectorizer=vectorizer_fit, transform_matrix=transform_matrix)
-                    downscale_vectorizer(vectorizer=vectorizer_fit, ngram_freq=ngram_freq, vocab_size=downsampled_vocab_size)
-                    # TODO: This doesn't have to be done twice, can update transform matrix based on new vocab instead of calling .transform
-                    #  If we have this functionality, simply update transform_matrix each time OOM occurs instead of re-calling .transform
-                    transform_matrix = vectorizer_fit.transform(text_data)
-
-            nlp_features_names = vectorizer_fit.get_feature_names()
-
-            X_nlp_features = pd.DataFrame(transform_matrix.toarray())  # FIXME
-            X_nlp_features.columns = [f'{nlp_feature}.{x}' for x in nlp_features_names]
-            X_nlp_features[nlp_feature + '._total_'] = X_nlp_features.gt(0).sum(axis=1)
-
-            X_nlp_features_combined.append(X_nlp_features)
+                    keep_idx = downscale_vectorizer(vectorizer=vectorizer_fit, ngram_freq=ngram_freq, vocab_size=downsampled_vocab_size)
+                    # Column-slice the already-computed matrix instead of re-tokenizing the corpus with the reduced vocabulary (CSC slices columns efficiently)
+                    transform_matrix = transform_matrix.tocsc()[:, keep_idx].tocsr()
 
+            if hasattr(vectorizer_fit, 'vocabulary_'):
+                nlp_features_columns += [f'{nlp_feature}.{x}' for x in vectorizer_fit.get_feature_names()]
+            else:
+                nlp_features_columns += [f'{nlp_feature}.hash.{x}' for x in range(transform_matrix.shape[1])]
+            transform_matrices.append(transform_matrix)
+            # Nonzero count per row, computed directly from CSR structure instead of densifying.
+            # indptr is typically int32 already, so copy=False makes the cast a no-op rather than a second allocation.
+            nlp_features_totals.append((nlp_feature + '._total_', np.diff(transform_matrix.indptr).astype(np.int32, copy=False)))
+
+        # All features stay CSR until the very end: one hstack and a single DataFrame construction,
+        # rather than one frame per feature followed by a concat.
+        X_nlp_features_combined = []
         if self.feature_transformations['text_ngram']:
-            X_nlp_features_combined = pd.concat(X_nlp_features_combined, axis=1)
+            combined_matrix = transform_matrices[0] if len(transform_matrices) == 1 else hstack(transform_matrices, format='csr')
+            # Hand the pre-built column Index to the constructor, avoiding the inference + reassignment pass of setting .columns afterwards
+            columns_index = pd.Index(nlp_features_columns)
+            if _PANDAS_SPARSE_DATAFRAME:
+                X_nlp_features_combined = pd.DataFrame.sparse.from_spmatrix(combined_matrix, columns=columns_index)
+                sparse_dtype = pd.SparseDtype(combined_matrix.dtype, 0)
+                if len(columns_index) > 0 and X_nlp_features_combined.dtypes.iloc[0] != sparse_dtype:
+                    # pandas defaults float sparse fill values to NaN, but absent ngram entries must read as 0
+                    X_nlp_features_combined = X_nlp_features_combined.astype(sparse_dtype)
+            else:
+                # Preallocate the dense buffer and fill it through toarray(out=...), which takes scipy's direct csr-to-dense path
+                dense_matrix = np.zeros(combined_matrix.shape, dtype=combined_matrix.dtype, order='C')
+                combined_matrix.toarray(out=dense_matrix)
+                X_nlp_features_combined = pd.DataFrame(dense_matrix, columns=columns_index, copy=False)
+            for total_column, total_values in nlp_features_totals:
+                X_nlp_features_combined[total_column] = total_values
 
         return X_nlp_features_combined
 
     def generate_text_special(self, X: Series, feature: str) -> DataFrame:
-        X_text_special: DataFrame = DataFrame(index=X.index)
-        X_text_special[feature + '.char_count'] = [self.char_count(value) for value in X]
-        X_text_special[feature + '.word_count'] = [self.word_count(value) for value in X]
-        X_text_special[feature + '.capital_ratio'] = [self.capital_ratio(value) for value in X]
-        X_text_special[feature + '.lower_ratio'] = [self.lower_ratio(value) for value in X]
-        X_text_special[feature + '.digit_ratio'] = [self.digit_ratio(value) for value in X]
-        X_text_special[feature + '.special_ratio'] = [self.special_ratio(value) for value in X]
-
-        symbols = ['!', '?', '@', '%', '$', '*', '&', '#', '^', '.', ':', ' ', '/', ';', '-', '=']
-        for symbol in symbols:
-            X_text_special[feature + '.symbol_count.' + symbol] = [self.symbol_in_string_count(value, symbol) for value in X]
-            X_text_special[feature + '.symbol_ratio.' + symbol] = X_text_special[feature + '.symbol_count.' + symbol] / X_text_special[feature + '.char_count']
-            X_text_special[feature + '.symbol_ratio.' + symbol].fillna(0, inplace=True)
-
-        return X_text_special
+        if text_special_kernels.numba_available:
+            return self._generate_text_special_numba(X, feature)
+        return self._generate_text_special_pandas(X, feature)
+
+    # When numba is installed, all counters are computed in one compiled pass over the UTF-8 bytes
+    # instead of one pandas string scan per feature.
+    def _generate_text_special_numba(self, X: Series, feature: str) -> DataFrame:
+        counts = text_special_kernels.generate_text_special_counts(X.values, self.symbols)
+        out = np.zeros((len(X), 6 + 2 * len(self.symbols)), dtype=np.float32)
+        char_count = counts[:, text_special_kernels.CHAR_COUNT]
+        no_space_len = (char_count - counts[:, text_special_kernels.SPACE_COUNT])[:, None]
+        base_counts = counts[:, [text_special_kernels.CAPITAL_COUNT, text_special_kernels.LOWER_COUNT, text_special_kernels.DIGIT_COUNT, text_special_kernels.SPECIAL_COUNT]]
+        symbol_counts = counts[:, text_special_kernels.NUM_BASE_COUNTERS:]
+        char_count_denom = char_count[:, None]
+        out[:, 0] = char_count
+        out[:, 1] = counts[:, text_special_kernels.WORD_COUNT]
+        np.divide(base_counts, no_space_len, out=out[:, 2:6], where=no_space_len > 0)
+        out[:, 6::2] = symbol_counts
+        np.divide(symbol_counts, char_count_denom, out=out[:, 7::2], where=char_count_denom > 0)
+        return self._build_text_special_frame(out, feature, X.index)
+
+    # Operates on the whole Series at once through pandas' cython string kernels, avoiding per-row Python calls
+    def _generate_text_special_pandas(self, X: Series, feature: str) -> DataFrame:
+        out = np.zeros((len(X), 6 + 2 * len(self.symbols)), dtype=np.float32)
+        char_count = X.str.len().values
+        char_count_denom = char_count[:, None]
+        out[:, 0] = char_count
+        out[:, 1] = X.str.split().str.len().values
+
+        no_space = X.str.replace(' ', '', regex=False)
+        no_space_len = no_space.str.len().values[:, None]
+        base_counts = np.column_stack([no_space.str.count(pattern).values for pattern in (r'[A-Z]', r'[a-z]', r'\d', r'[^\w]')])
+        np.divide(base_counts, no_space_len, out=out[:, 2:6], where=no_space_len > 0)
+
+        # One masked divide over the stacked count matrix instead of a divide + NaN fill per symbol
+        symbol_counts = np.column_stack([X.str.count(re.escape(symbol)).values for symbol in self.symbols])
+        out[:, 6::2] = symbol_counts
+        np.divide(symbol_counts, char_count_denom, out=out[:, 7::2], where=char_count_denom > 0)
+
+        return self._build_text_special_frame(out, feature, X.index)
+
+    # Wraps the pre-sized feature matrix in a single DataFrame construction, avoiding the block-manager
+    # insert + consolidation that per-column assignment incurs on wide outputs.
+    def _build_text_special_frame(self, out, feature, index):
+        columns = [feature + '.char_count', feature + '.word_count', feature + '.capital_ratio',
+                   feature + '.lower_ratio', feature + '.digit_ratio', feature + '.special_ratio']
+        for symbol in self.symbols:
+            columns += [feature + '.symbol_count.' + symbol, feature + '.symbol_ratio.' + symbol]
+        X_text_special = DataFrame(out, index=index, columns=columns, copy=False)
+        count_columns = {column: np.int32 for column in columns if '.symbol_count.' in column or column.endswith('.char_count') or column.endswith('.word_count')}
+        return X_text_special.astype(count_columns)
 
     @staticmethod
     def word_count(string):
@@ -251,29 +357,28 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
 
     @staticmethod
     def special_ratio(string):
-        string = string.replace(' ', '')
+        string = string.translate(AutoMLFeatureGenerator._drop_space_table)
         if not string:
             return 0
-        new_str = re.sub(r'[\w]+', '', string)
-        return len(new_str) / len(string)
+        return sum(1 for c in string if not (c.isalnum() or c == '_')) / len(string)
 
     @staticmethod
     def digit_ratio(string):
-        string = string.replace(' ', '')
+        string = string.translate(AutoMLFeatureGenerator._drop_space_table)
         if not string:
             return 0
         return sum(c.isdigit() for c in string) / len(string)
 
     @staticmethod
     def lower_ratio(string):
-        string = string.replace(' ', '')
+        string = string.translate(AutoMLFeatureGenerator._drop_space_table)
         if not string:
             return 0
         return sum(c.islower() for c in string) / len(string)
 
     @staticmethod
     def capital_ratio(string):
-        string = string.replace(' ', '')
+        string = string.translate(AutoMLFeatureGenerator._drop_space_table)
         if not string:
             return 0
         return sum(1 for c in string if c.isupper()) / len(string)
@@ -284,10 +389,91 @@ class AutoMLFeatureGenerator(AbstractFeatureGenerator):
             return 0
         return sum(1 for c in string if c == character)
 
+    # Builds the combined '__nlp__' text stream as an object ndarray. With a single text feature
+    # the per-row join is skipped entirely and the column's backing array is used as-is.
+    # drop_duplicates dedups the row tuples on pandas' C hashtable before any join work happens,
+    # which is what vectorizer fitting wants (Python set hashing of joined strings was far slower).
+    def _get_joined_text(self, X, drop_duplicates=False):
+        text_features = self.feature_transformations['text_ngram']
+        if drop_duplicates:
+            X = X[text_features].drop_duplicates()
+        if len(text_features) == 1:
+            return X[text_features[0]].values
+        text_data = np.empty(len(X), dtype=object)
+        for i, value in enumerate(self._iter_joined_text(X, text_features)):
+            text_data[i] = value
+        return text_data
+
+    # Yields one concatenated string per row; itertuples avoids materializing a row ndarray per row
+    # and callers avoid holding an intermediate list of all joined strings.
+    @staticmethod
+    def _iter_joined_text(X, columns):
+        for row in X[columns].itertuples(index=False, name=None):
+            yield '. '.join(row)
+
+    # Duplicate rows are common in tabular text columns; when enough rows repeat, transform only the
+    # unique strings and expand back through the inverse index (CSR row fancy-indexing is cheap).
+    def _transform_text(self, vectorizer_fit, text_data):
+        text_arr = np.asarray(text_data, dtype=object)
+        unique_values, inverse = np.unique(text_arr, return_inverse=True)
+        if len(unique_values) < 0.7 * len(text_arr):
+            return self._transform_text_chunked(vectorizer_fit, unique_values)[inverse]
+        return self._transform_text_chunked(vectorizer_fit, text_arr)
+
+    # sklearn tokenization is single-threaded; large inputs are split into per-worker chunks that are
+    # transformed in parallel and vstacked. The vocabulary is shared, so no merge step is needed.
+    def _transform_text_chunked(self, vectorizer_fit, text_arr):
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs <= 1 or len(text_arr) < self.TEXT_TRANSFORM_CHUNK_MIN_ROWS:
+            return vectorizer_fit.transform(text_arr)
+        parts = Parallel(n_jobs=n_jobs, backend='loky')(delayed(vectorizer_fit.transform)(chunk) for chunk in np.array_split(text_arr, n_jobs))
+        return vstack(parts, format='csr')
+
+    # Rough pre-fit memory estimate; lets the hashing fallback kick in before an oversized
+    # vocabulary is ever fit and the OOM retry loop triggers. Vocabulary size is estimated as
+    # min(max_features, unique token count), so small inputs never trigger the fallback.
+    def _should_use_hashing_vectorizer(self, X, text_lists):
+        vocab_size_estimate = self._estimate_vocab_size(text_lists)
+        max_features = getattr(self.vectorizer_default_raw, 'max_features', None)
+        if max_features is not None:
+            vocab_size_estimate = min(max_features, vocab_size_estimate)
+        itemsize = np.dtype(self.vectorizer_default_raw.dtype).itemsize
+        predicted_bytes = len(X) * vocab_size_estimate * itemsize
+        max_memory_percentage = 0.15  # aligned with the post-transform memory check
+        return predicted_bytes > psutil.virtual_memory().available * max_memory_percentage
+
+    # Counts unique whitespace tokens over a row sample, extrapolated sub-linearly to the full
+    # corpus (vocabulary growth flattens with corpus size) and scaled by the number of ngram orders.
+    def _estimate_vocab_size(self, text_lists):
+        ngram_range = getattr(self.vectorizer_default_raw, 'ngram_range', (1, 1))
+        num_ngram_orders = ngram_range[1] - ngram_range[0] + 1
+        vocab_size_estimate = 0
+        for text_list in text_lists:
+            sample_size = min(len(text_list), self.VOCAB_ESTIMATE_SAMPLE_ROWS)
+            tokens = set()
+            for value in text_list[:sample_size]:
+                tokens.update(value.split())
+            unique_tokens = len(tokens)
+            if sample_size and len(text_list) > sample_size:
+                unique_tokens = int(unique_tokens * np.sqrt(len(text_list) / sample_size))
+            vocab_size_estimate += unique_tokens * num_ngram_orders
+        return vocab_size_estimate
+
+    # train_vectorizer wrapper that converts the empty-vocabulary ValueError into None, so per-feature
+    # failures can be handled individually when multiple vectorizers are fit in parallel.
+    @staticmethod
+    def _train_vectorizer_or_none(text_list, vectorizer):
+        try:
+            vectorizer_fit, _ = AutoMLFeatureGenerator.train_vectorizer(text_list, vectorizer)
+            return vectorizer_fit
+        except ValueError:
+            return None
+
     @staticmethod
     def train_vectorizer(text_list, vectorizer):
         logger.log(15, 'Fitting vectorizer...')
         transform_matrix = vectorizer.fit_transform(text_list)  # TODO: Consider upgrading to pandas 0.25.0 to benefit from sparse attribute improvements / bug fixes! https://pandas.pydata.org/pandas-docs/stable/whatsnew/v0.25.0.html
         vectorizer.stop_words_ = None  # Reduces object size by 100x+ on large datasets, no effect on usability
-        logger.log(15, f'Vectorizer fit with vocabulary size = {len(vectorizer.vocabulary_)}')
+        vocab_size = len(vectorizer.vocabulary_) if hasattr(vectorizer, 'vocabulary_') else vectorizer.n_features
+        logger.log(15, f'Vectorizer fit with vocabulary size = {vocab_size}')
         return vectorizer, transform_matrix
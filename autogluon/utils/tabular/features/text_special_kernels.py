@@ -0,0 +1,100 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Numba is an optional dependency. When present, text_special features are computed in a single
+# compiled pass over the raw UTF-8 bytes instead of one pandas string scan per feature.
+try:
+    from numba import njit, prange
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+# Counter layout produced by the kernel, per row. Symbol counts follow starting at index 7.
+CHAR_COUNT = 0
+WORD_COUNT = 1
+CAPITAL_COUNT = 2
+LOWER_COUNT = 3
+DIGIT_COUNT = 4
+SPECIAL_COUNT = 5
+SPACE_COUNT = 6
+NUM_BASE_COUNTERS = 7
+
+# class-table sentinel for UTF-8 continuation bytes, which are not characters of their own
+_CONTINUATION = -2
+
+
+# 256-entry table mapping each byte to the counter it increments (or -1 for none), so the kernel's
+# inner loop is a single lookup instead of a branch chain plus a scan over the symbol list.
+def _build_class_table():
+    table = np.full(256, -1, dtype=np.int16)
+    table[0x80:0xC0] = _CONTINUATION
+    table[0x30:0x3A] = DIGIT_COUNT
+    table[0x41:0x5B] = CAPITAL_COUNT
+    table[0x61:0x7B] = LOWER_COUNT
+    table[0x20] = SPACE_COUNT
+    for c in range(0x80):
+        if table[c] == -1 and c != 0x5F:  # remaining ASCII except '_' counts as special
+            table[c] = SPECIAL_COUNT
+    return table
+
+
+def _build_is_space_table():
+    table = np.zeros(256, dtype=np.bool_)
+    table[0x20] = True
+    table[0x09:0x0E] = True
+    return table
+
+
+_CLASS_TABLE = _build_class_table()
+_IS_SPACE_TABLE = _build_is_space_table()
+
+
+def pack_utf8(values):
+    """Concatenates the strings of `values` into one contiguous UTF-8 byte buffer plus row offsets."""
+    encoded = [value.encode('utf-8') if isinstance(value, str) else b'' for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    for i, row in enumerate(encoded):
+        offsets[i + 1] = offsets[i] + len(row)
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return buf, offsets
+
+
+if numba_available:
+    @njit(parallel=True, cache=True)
+    def _text_special_kernel(buf, offsets, class_table, is_space_table, symbol_table, out):  # pragma: no cover - compiled
+        n_rows = offsets.shape[0] - 1
+        for i in prange(n_rows):
+            prev_is_space = True
+            for pos in range(offsets[i], offsets[i + 1]):
+                c = buf[pos]
+                class_idx = class_table[c]
+                if class_idx == _CONTINUATION:
+                    continue
+                out[i, CHAR_COUNT] += 1
+                is_space = is_space_table[c]
+                if prev_is_space and not is_space:
+                    out[i, WORD_COUNT] += 1
+                prev_is_space = is_space
+                if class_idx >= 0:
+                    out[i, class_idx] += 1
+                symbol_idx = symbol_table[c]
+                if symbol_idx >= 0:
+                    out[i, symbol_idx] += 1
+
+
+def generate_text_special_counts(values, symbols):
+    """Computes all text_special counters for `values` in one fused pass.
+
+    Returns an int32 matrix of shape (n_rows, NUM_BASE_COUNTERS + len(symbols)) following the
+    counter layout above. Only valid to call when `numba_available` is True.
+    """
+    buf, offsets = pack_utf8(values)
+    symbol_table = np.full(256, -1, dtype=np.int16)
+    for k, symbol in enumerate(symbols):
+        symbol_table[ord(symbol)] = NUM_BASE_COUNTERS + k
+    out = np.zeros((len(offsets) - 1, NUM_BASE_COUNTERS + len(symbols)), dtype=np.int32)
+    _text_special_kernel(buf, offsets, _CLASS_TABLE, _IS_SPACE_TABLE, symbol_table, out)
+    return out
@@ -2,6 +2,7 @@ import logging
 from collections import defaultdict
 
 import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +10,9 @@ logger = logging.getLogger(__name__)
 def get_type_family(dtype):
     """From dtype, gets the dtype family."""
     try:
+        if isinstance(dtype, pd.SparseDtype):
+            # Sparse-backed columns (ngram features) belong to the family of the values they store
+            dtype = dtype.subtype
         if dtype.name is 'category':
             return 'category'
         if 'datetime' in dtype.name:
@@ -1,13 +1,19 @@
 from collections import Counter
 
 import numpy as np
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
 
 
 def vectorizer_auto_ml_default():
     return CountVectorizer(min_df=30, ngram_range=(1, 3), max_features=10000, dtype=np.uint8)
 
 
+# Stores no vocabulary, transform is a pure streaming hash with memory bounded by n_features.
+# norm=None + alternate_sign=False keeps raw nonnegative counts like CountVectorizer.
+def vectorizer_hashing_default():
+    return HashingVectorizer(ngram_range=(1, 3), n_features=2 ** 18, alternate_sign=False, norm=None, dtype=np.float32)
+
+
 def get_ngram_freq(vectorizer, transform_matrix):
     names = vectorizer.get_feature_names()
     frequencies = transform_matrix.sum(axis=0).tolist()[0]
@@ -16,9 +22,14 @@ def get_ngram_freq(vectorizer, transform_matrix):
 
 
 # Reduces vectorizer vocabulary size to vocab_size, keeping highest frequency ngrams
+# Returns the original column indices of the retained ngrams ordered by new index, so an
+# existing transform matrix can be column-sliced instead of re-tokenizing the corpus.
 def downscale_vectorizer(vectorizer, ngram_freq, vocab_size):
     counter = Counter(ngram_freq)
     top_n = counter.most_common(vocab_size)
     top_n_names = sorted([name for name, _ in top_n])
+    vocab_prior = vectorizer.vocabulary_
+    keep_idx = np.array([vocab_prior[name] for name in top_n_names], dtype=np.int64)
     new_vocab = {name: i for i, name in enumerate(top_n_names)}
     vectorizer.vocabulary_ = new_vocab
+    return keep_idx
@@ -223,7 +223,7 @@ class AbstractModel:
         if self.features is not None:
             # TODO: In online-inference this becomes expensive, add option to remove it (only safe in controlled environment where it is already known features are present
             if list(X.columns) != self.features:
-                return X[self.features]
+                X = X[self.features]
         else:
             self.features = list(X.columns)  # TODO: add fit and transform versions of preprocess instead of doing this
             ignored_feature_types_raw = self.params_aux.get('ignored_feature_types_raw', [])
@@ -239,6 +239,12 @@ class AbstractModel:
             if ignored_feature_types_raw or ignored_feature_types_special:
                 if list(X.columns) != self.features:
                     X = X[self.features]
+        # Ngram features arrive sparse-backed to save memory during feature generation, but the pinned
+        # lightgbm/catboost versions reject pandas sparse dtypes, so models always consume dense values.
+        sparse_features = [feature for feature, dtype in X.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+        if sparse_features:
+            X = X.copy()
+            X[sparse_features] = X[sparse_features].sparse.to_dense()
         return X
 
     def _preprocess_fit_args(self, **kwargs):
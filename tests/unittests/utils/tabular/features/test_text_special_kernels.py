@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.utils.tabular.features import text_special_kernels
+from autogluon.utils.tabular.features.auto_ml_feature_generator import AutoMLFeatureGenerator
+
+# ASCII edge cases the vectorized paths must handle identically to the per-row helpers.
+# The numba byte kernel and the pandas fallback intentionally diverge on non-ASCII input,
+# so equivalence is only enforced over ASCII.
+EDGE_CASE_STRINGS = [
+    '',
+    ' ',
+    '     ',
+    '\tleading tab\nand newline\t',
+    '_underscores_are_word_chars_',
+    'MiXeD CaSe 123 words',
+    'a',
+    '...',
+    'word  double  spaces',
+    'trailing space ',
+]
+
+
+@pytest.fixture
+def text_series():
+    strings = EDGE_CASE_STRINGS + [symbol * 3 for symbol in AutoMLFeatureGenerator.symbols]
+    return pd.Series(strings, name='txt')
+
+
+def expected_text_special_frame(X, feature):
+    """Builds the text_special frame row by row through the baseline per-row helpers."""
+    generator = AutoMLFeatureGenerator()
+    out = np.zeros((len(X), 6 + 2 * len(generator.symbols)), dtype=np.float32)
+    for i, value in enumerate(X.values):
+        out[i, 0] = generator.char_count(value)
+        out[i, 1] = generator.word_count(value)
+        out[i, 2] = generator.capital_ratio(value)
+        out[i, 3] = generator.lower_ratio(value)
+        out[i, 4] = generator.digit_ratio(value)
+        out[i, 5] = generator.special_ratio(value)
+        for k, symbol in enumerate(generator.symbols):
+            count = generator.symbol_in_string_count(value, symbol)
+            out[i, 6 + 2 * k] = count
+            out[i, 7 + 2 * k] = count / len(value) if value else 0
+    return generator._build_text_special_frame(out, feature, X.index)
+
+
+def test_text_special_pandas_matches_row_helpers(text_series):
+    generator = AutoMLFeatureGenerator()
+    output = generator._generate_text_special_pandas(text_series, 'txt')
+    expected = expected_text_special_frame(text_series, 'txt')
+    pd.testing.assert_frame_equal(output, expected)
+
+
+@pytest.mark.skipif(not text_special_kernels.numba_available, reason='numba is not installed')
+def test_text_special_numba_matches_pandas(text_series):
+    generator = AutoMLFeatureGenerator()
+    output_numba = generator._generate_text_special_numba(text_series, 'txt')
+    output_pandas = generator._generate_text_special_pandas(text_series, 'txt')
+    pd.testing.assert_frame_equal(output_numba, output_pandas)